@@ -1,29 +1,107 @@
 import requests
-import pdfplumber
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pymupdf
 import pandas as pd
 import os
+import csv
 import json
 import re
-from time import sleep
+import html
+import hashlib
+import shelve
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from time import sleep, monotonic
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from io import BytesIO
+from urllib.parse import urljoin, urlparse
 import warnings
 from typing import Dict, Any, Tuple
 from datetime import datetime
 
-warnings.filterwarnings("ignore", message="Could not get FontBBox")
-warnings.filterwarnings("ignore", message="Could not get FontBBox from font descriptor")
-warnings.filterwarnings("ignore", message="Not adding object")
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # parquet output is optional
+    pa = pq = None
+
+try:
+    import lxml  # noqa: F401 - only needed as the BeautifulSoup backend
+    HTML_PARSER = "lxml"
+except ImportError:  # stdlib parser is slower but always there
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:  # falls back to the stdlib json encoder
+    orjson = None
+
 warnings.filterwarnings("ignore", category=UserWarning)
+pymupdf.TOOLS.mupdf_display_errors(False)
 
 # constants
 START_YEAR = 2004 # 1995 original
 END_YEAR = 2004 # 2025 original
 OUTPUT_FOLDER = "downloads"
+OUTPUT_DIR = Path(OUTPUT_FOLDER)
 RESULTS_CSV = "law_review_prelim_results.csv"
+RESULTS_JSONL = "law_review_prelim_results.jsonl"
+RESULTS_PARQUET = "law_review_prelim_results.parquet"
 FLAGGED_ISSUES_JSON = "flagged_issues.json"
 CLASSIFICATION_LOG = "classification_log.json"
+SCRAPE_CACHE = "scrape_cache.db"  # shelve of url -> article record, makes reruns incremental
+DIGEST_KEY_PREFIX = "parsed-sha256:"  # cache keys for pdf digest -> parse metadata, so identical pdfs are parsed once
+DOWNLOAD_WORKERS = 8  # concurrent article fetches
+MAX_CONNECTIONS_PER_HOST = 4  # in-flight requests allowed against any one host
+PARSE_WORKERS = os.cpu_count() or 1  # processes for CPU-bound PDF parsing, one per core
+# parse workers start on the first submit, from a download thread while other threads run;
+# forking a threaded process can copy a held lock into the child, so they come from a forkserver
+PARSE_START_METHOD = "forkserver"
+MAX_REQUESTS_PER_SECOND = 4  # per host, enforced by HostRateLimiter
+HEAD_PROBE = True  # HEAD each landing page first so missing articles cost no body transfer
+ISSUE_INDEX = True  # read each issue's table of contents for its article numbers instead of probing 1-20
+REVALIDATE_CACHE = False  # re-check cached pdfs with a conditional GET instead of trusting the cache
+
+# process umask, read once at import (os.umask can only be read by setting it, which is not thread safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# every code point str.isspace() accepts (all of them sit below U+3001)
+WHITESPACE_CHARS = ''.join(chr(i) for i in range(0x3001) if chr(i).isspace())
+
+# result columns in output order, with the dtype each column is built with (object when None);
+# the csv, jsonl and parquet outputs carry exactly these (pdf_url, pdf_etag and pdf_last_modified
+# also sit on each record, but only as cache bookkeeping for revalidation)
+RESULT_COLUMNS = {
+    'journal': None,
+    'year': 'int16',
+    'volume': 'int16',
+    'issue': 'int16',
+    'article': 'int16',  # numbers come from the issue page, so no cap at 20
+    'title': None,
+    'authors': None,
+    'author_count': 'Int8',  # nullable, records cached before it was tracked have none
+    'multi_author': 'bool',
+    'words': 'int32',
+    'main_text_words': 'int32',
+    'footnote_words': 'int32',
+    'char_count_total': 'int64',
+    'char_count_no_space': 'int64',
+    'pages': 'int16',
+    'has_footnote_separator': 'bool',
+    'ocr_used': 'bool',
+    'classification_label': None,
+    'classification_steps': None,
+    'requires_manual_review': 'bool',
+    'url': None,
+    'filename': None,
+    'pdf_sha256': None,
+}
 
 # URLs
 BASE_URL = "https://scholarship.law.duke.edu/dlj/vol{volume}/iss{issue}/{article}/"
@@ -35,6 +113,54 @@ PEPPERDINE_JOURNAL_START_YEAR = 1974
 UCHICAGO_BASE_URL = "https://chicagounbound.uchicago.edu/uclrev/vol{volume}/iss{issue}/{article}/"
 UCHICAGO_JOURNAL_START_YEAR = 1933  # vol 62 is 1995
 
+def make_session():
+    # http session - keep-alive connection pool (one per journal host) shared by every request
+    session = requests.Session()
+    session.headers["User-Agent"] = "pilotmila/1.0 (law review metadata research)"
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+class HostRateLimiter:
+    # sliding one-second window of request times per host; callers only sleep once a host is at max_rps
+    
+    def __init__(self, max_rps):
+        self.max_rps = max_rps
+        self._windows = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, host):
+        while True:
+            with self._lock:
+                window = self._windows.setdefault(host, deque())
+                now = monotonic()
+                while window and now - window[0] >= 1.0:
+                    window.popleft()
+                if len(window) < self.max_rps:
+                    window.append(now)
+                    return
+                delay = 1.0 - (now - window[0])
+            sleep(delay)
+
+RATE_LIMITER = HostRateLimiter(MAX_REQUESTS_PER_SECOND)
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+@contextmanager
+def polite_request(session, method, url, **kwargs):
+    # caps in-flight requests and request rate per host (429 Retry-After is honoured by the session's Retry);
+    # the host slot is held until the response is closed, so streamed bodies count against the cap too
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.setdefault(host, threading.Semaphore(MAX_CONNECTIONS_PER_HOST))
+    with slot:
+        RATE_LIMITER.wait(host)
+        with session.request(method, url, **kwargs) as response:
+            yield response
+
 # classification pipeline updated with LLM fallback
 
 class LawReviewClassifier:
@@ -55,6 +181,18 @@ class LawReviewClassifier:
         'STUDENT_CONTRIBUTION': ['STUDENT CONTRIBUTION', 'STUDENT CONTRIBUTIONS']
     }
     
+    # student class year, matched on lowercased text
+    CLASS_YEAR_RE = re.compile(r'class of (\d{4})')
+    
+    # step D single-threshold checks: label -> (must_exceed, threshold, label_if_met, label_if_not)
+    LENGTH_CHECKS = {
+        'Article': (True, 15000, 'Article (confirmed)', 'ERROR'),
+        'Essay': (False, 20000, 'Essay (confirmed)', 'ERROR'),
+        'Article_OR_Essay': (True, 15000, 'Article', 'Essay'),
+        'Note': (False, 18000, 'Note (confirmed)', 'ERROR'),
+        'Comment': (False, 10000, 'Comment (confirmed)', 'ERROR'),
+    }
+    
     def __init__(self):
         self.classification_log = []
     
@@ -94,6 +232,28 @@ class LawReviewClassifier:
         
         return result
     
+    def log_cached(self, record: Dict[str, Any]) -> None:
+        # adds the log entry classify() made for a record classified in an earlier run
+        # (step A labels are never logged, same as in classify)
+        steps = record['classification_steps']
+        if steps and steps[-1]['step'] == 'A':
+            return
+        
+        result = {
+            'label': record['classification_label'],
+            'steps': steps,
+            'confidence': 0.0,
+            'errors': []
+        }
+        if record['requires_manual_review']:
+            result['requires_manual_review'] = True
+        
+        self.classification_log.append({
+            'title': record['title'],
+            'year': record['year'],
+            'result': result
+        })
+    
     def _step_a_preprocessing(self, paper_data: Dict, result: Dict) -> Dict:
         # filters short papers (read above)
         pages = paper_data.get('pages', 0)
@@ -121,15 +281,13 @@ class LawReviewClassifier:
         # check KWs from from section headers first 3 pgs
         text = paper_data.get('main_text', '')
         
-        # estimate: ~250-300 words per page for extraction first three pgs
-        first_3_pages = ' '.join(text.split()[:1000])
-        
-        # KW search
+        # KW search (the header window is sliced once, not once per keyword)
+        header_text = text[:3000]
         found_keywords = {category: [] for category in self.SECTION_KEYWORDS}
         
         for category, keywords in self.SECTION_KEYWORDS.items():
             for keyword in keywords:
-                if keyword in text[:3000]:  # actual search
+                if keyword in header_text:  # actual search
                     found_keywords[category].append(keyword)
         
         # count KW types found
@@ -195,18 +353,18 @@ class LawReviewClassifier:
         if result['label'] != 'Unlabeled':
             return result
         
-        main_text = paper_data.get('main_text', '').lower()
+        # the author footnote (j.d. candidate / class of) sits below the separator on the first page
+        student_text = (paper_data.get('main_text', '') + ' ' + paper_data.get('footnotes_text', '')).lower()
         word_count = paper_data.get('words', 0)
         
-        jd_candidate_match = 'j.d. candidate' in main_text
+        jd_candidate_match = 'j.d. candidate' in student_text
         class_year_match = False
         
         if not jd_candidate_match:
-            class_pattern = r'class of (\d{4})'
-            class_matches = re.findall(class_pattern, main_text)
-            for class_year_str in class_matches:
+            # finditer so the scan stops at the first class year close enough to the publication year
+            for class_match in self.CLASS_YEAR_RE.finditer(student_text):
                 try:
-                    class_year = int(class_year_str)
+                    class_year = int(class_match.group(1))
                     if abs(class_year - publication_year) <= 3:
                         class_year_match = True
                         break
@@ -243,32 +401,39 @@ class LawReviewClassifier:
         word_count = paper_data.get('words', 0)
         current_label = result['label']
         
-        # length-based assignments if still unlabeled
-        validation_table = {
-            'Article': (lambda wc: wc > 15000, 'Article (confirmed)', 'ERROR'),
-            'Essay': (lambda wc: wc < 20000, 'Essay (confirmed)', 'ERROR'),
-            'Article_OR_Essay': (lambda wc: wc > 15000, 'Article', 'Essay'),
-            'Note': (lambda wc: wc < 18000, 'Note (confirmed)', 'ERROR'),
-            'Comment': (lambda wc: wc < 10000, 'Comment (confirmed)', 'ERROR'),
-            'Note_OR_Comment': (lambda wc: ('Comment' if wc < 10000 else ('Note' if 10000 <= wc <= 20000 else 'ERROR')), None, None),
-            'Unlabeled': (lambda wc: ('Article' if wc > 18000 else ('Note' if wc >= 10000 else 'Comment')), None, None),
-            'Miscellaneous': (lambda wc: True, 'Miscellaneous', 'Miscellaneous'),
-        }
-        
-        if current_label in validation_table:
-            if current_label == 'Note_OR_Comment' or current_label == 'Unlabeled':
-                condition_fn, _, _ = validation_table[current_label]
-                final_label = condition_fn(word_count)
+        # length-based assignments if still unlabeled (the ranged labels have no single condition)
+        condition_met = None
+        if current_label == 'Note_OR_Comment':
+            if word_count < 10000:
+                final_label = 'Comment'
+            elif word_count <= 20000:
+                final_label = 'Note'
             else:
-                condition_fn, label_if_true, label_if_false = validation_table[current_label]
-                final_label = label_if_true if condition_fn(word_count) else label_if_false
-            
+                final_label = 'ERROR'
+        elif current_label == 'Unlabeled':
+            if word_count > 18000:
+                final_label = 'Article'
+            elif word_count >= 10000:
+                final_label = 'Note'
+            else:
+                final_label = 'Comment'
+        elif current_label == 'Miscellaneous':
+            condition_met = True
+            final_label = 'Miscellaneous'
+        elif current_label in self.LENGTH_CHECKS:
+            must_exceed, threshold, label_if_met, label_if_not = self.LENGTH_CHECKS[current_label]
+            condition_met = word_count > threshold if must_exceed else word_count < threshold
+            final_label = label_if_met if condition_met else label_if_not
+        else:
+            final_label = None
+        
+        if final_label is not None:
             result['steps'].append({
                 'step': 'D',
                 'name': 'Validation (Length-Based Refinement)',
                 'current_label': current_label,
                 'word_count': word_count,
-                'condition_met': condition_fn(word_count) if current_label not in ['Note_OR_Comment', 'Unlabeled'] else None,
+                'condition_met': condition_met,
                 'final_label': final_label
             })
             
@@ -300,42 +465,104 @@ class LawReviewClassifier:
 
 # metadata extraction section
 
-def download_pdf(url):
-    # gets metadata on authors, etc.
+# landing page parsing - bepress pages are regular enough for regexes on the raw bytes
+_CITATION_TITLE_RE = re.compile(rb'<meta[^>]+name="citation_title"[^>]+content="([^"]*)"', re.I)
+_CITATION_AUTHOR_RE = re.compile(rb'<meta[^>]+name="citation_author"[^>]+content="([^"]*)"', re.I)
+_PDF_LINK_RE = re.compile(rb'<a\s[^>]*href="([^"]*viewcontent\.cgi[^"]*)"', re.I)
+# css selectors for the BeautifulSoup fallback
+_CITATION_TITLE_SEL = 'meta[name="citation_title"]'
+_CITATION_AUTHOR_SEL = 'meta[name="citation_author"]'
+_AUTHOR_LINK_SEL = 'a[href*="author="], a[href*="q=author"]'
+_PDF_LINK_SEL = 'a[href*="viewcontent.cgi"]'
+
+def parse_landing_page(content, encoding):
+    # returns (title, authors, pdf link); falls back to BeautifulSoup when a regex misses
+    def decode(raw):
+        return html.unescape(raw.decode(encoding, 'replace'))
+    
+    title_match = _CITATION_TITLE_RE.search(content)
+    pdf_match = _PDF_LINK_RE.search(content)
+    authors = [decode(m.group(1)) for m in _CITATION_AUTHOR_RE.finditer(content) if m.group(1)]
+    if title_match and pdf_match and authors:
+        return decode(title_match.group(1)), authors, decode(pdf_match.group(1))
+    
+    soup = BeautifulSoup(content, HTML_PARSER, from_encoding=encoding)
+    
+    # title extraction
+    page_title = None
+    citation_meta = soup.select_one(_CITATION_TITLE_SEL)
+    if citation_meta:
+        page_title = citation_meta.get("content")
+    else:
+        title_elem = soup.find("h1") or soup.find("h2")
+        if title_elem:
+            page_title = title_elem.get_text(strip=True)
+    
+    # author extraction
+    authors = []
+    author_meta_tags = soup.select(_CITATION_AUTHOR_SEL)
+    authors = [tag.get("content") for tag in author_meta_tags if tag.get("content")]
+    
+    if not authors:
+        # dict.fromkeys drops repeat links to the same author but keeps page order
+        author_names = (link.get_text(strip=True) for link in soup.select(_AUTHOR_LINK_SEL))
+        authors = list(dict.fromkeys(name for name in author_names if name))
+    
+    # PDF link extraction
+    pdf_link = None
+    pdf_anchor = soup.select_one(_PDF_LINK_SEL)
+    if pdf_anchor:
+        pdf_link = pdf_anchor["href"]
+    
+    return page_title, authors, pdf_link
+
+
+def is_pdf_response(response):
+    # a 200 that actually carries a pdf (missing articles can come back as an html error page)
+    return response.status_code == 200 and 'application/pdf' in response.headers.get('Content-Type', '')
+
+
+def stream_pdf(pdf_response, dest_dir=OUTPUT_DIR):
+    # streams a pdf response into a temp file in dest_dir and returns (path, sha256 hex digest);
+    # hashes while streaming to disk so the file is never read back just for its checksum
+    pdf_response.raw.decode_content = True
+    fd, pdf_path = tempfile.mkstemp(suffix='.part', dir=dest_dir)
+    # mkstemp files are owner-only; saved pdfs get the usual permissions a plain open() would give
+    os.chmod(pdf_path, 0o666 & ~_UMASK)
+    sha256 = hashlib.sha256()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: pdf_response.raw.read(65536), b''):
+                sha256.update(chunk)
+                f.write(chunk)
+    except Exception:
+        os.remove(pdf_path)
+        raise
+    return pdf_path, sha256.hexdigest()
+
+
+def download_pdf(url, session, dest_dir=OUTPUT_DIR, probe=True):
+    # gets metadata on authors, etc. and streams the pdf into a temp file in dest_dir
+    # returns a dict describing the download, or None if the article is missing
+    # probe=False skips the HEAD for urls already known to exist (listed on the issue page)
     try:
         print(f" downloading: {url}")
-        response = requests.get(url, timeout=30)
-        if response.status_code != 200:
-            print(f" error: page not found ({response.status_code})")
-            return None, None, None, None
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # title extraction
-        page_title = None
-        citation_meta = soup.find("meta", {"name": "citation_title"})
-        if citation_meta:
-            page_title = citation_meta.get("content")
-        else:
-            title_elem = soup.find("h1") or soup.find("h2")
-            if title_elem:
-                page_title = title_elem.get_text(strip=True)
-        
-        # author extraction
-        authors = []
-        author_meta_tags = soup.find_all("meta", {"name": "citation_author"})
-        authors = [tag.get("content") for tag in author_meta_tags if tag.get("content")]
-        
-        if not authors:
-            author_links = soup.find_all("a", href=True)
-            seen_authors = set()
-            for link in author_links:
-                href = link.get("href", "")
-                if "author=" in href or "q=author" in href:
-                    author_name = link.get_text(strip=True)
-                    if author_name and author_name not in seen_authors:
-                        authors.append(author_name)
-                        seen_authors.add(author_name)
+        if probe and HEAD_PROBE:
+            # some servers refuse HEAD (405/501) - those fall through to the GET below
+            with polite_request(session, "HEAD", url, timeout=10, allow_redirects=True) as head_response:
+                head_status = head_response.status_code
+            if head_status not in (200, 405, 501):
+                print(f" error: page not found ({head_status})")
+                return None
+        
+        # streamed so a non-200 response is dropped after its headers
+        with polite_request(session, "GET", url, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                print(f" error: page not found ({response.status_code})")
+                return None
+            content = response.content
+        
+        page_title, authors, pdf_link = parse_landing_page(content, response.encoding or 'utf-8')
         
         author_count = len(authors)
         is_multi_author = author_count > 1
@@ -344,132 +571,127 @@ def download_pdf(url):
         if author_count > 0:
             print(f"  Authors found: {authors_string} (count: {author_count})")
         
-        # PDF link extraction
-        pdf_link = None
-        for a in soup.find_all("a", href=True):
-            if "viewcontent.cgi" in a["href"]:
-                pdf_link = a["href"]
-                break
         if not pdf_link:
             print(" no pdf link found on page.")
-            return None, None, None, None
+            return None
         
         pdf_url = urljoin(url, pdf_link)
         print(f" downloading pdf: {pdf_url}")
 
-        pdf_response = requests.get(pdf_url, timeout=30)
-        if pdf_response.status_code == 200 and 'application/pdf' in pdf_response.headers.get('Content-Type', ''):
-            return pdf_response.content, page_title, authors_string, is_multi_author
-        else:
-            print(f" error: pdf not returned ({pdf_response.status_code})")
-            return None, None, None, None
+        with polite_request(session, "GET", pdf_url, timeout=30, stream=True) as pdf_response:
+            if is_pdf_response(pdf_response):
+                pdf_path, sha256 = stream_pdf(pdf_response, dest_dir)
+                return {
+                    'pdf_path': pdf_path,
+                    'title': page_title,
+                    'authors': authors_string,
+                    'author_count': author_count,
+                    'multi_author': is_multi_author,
+                    'pdf_url': pdf_url,
+                    'sha256': sha256,
+                    'etag': pdf_response.headers.get('ETag'),
+                    'last_modified': pdf_response.headers.get('Last-Modified')
+                }
+            else:
+                print(f" error: pdf not returned ({pdf_response.status_code})")
+                return None
         
     except Exception as e:
         print(f" Error: {e}")
-        return None, None, None, None
+        return None
 
 # text extraction and footnote detection
 
-def find_footnote_separator(pdf_content):
-    # detects horizontal line separator
+# front matter / table of contents markers for the review flags, matched against lowercased text
+_TOC_RE = re.compile(r"contents|table of")
+_INTRO_RE = re.compile(r"editor|foreword|preface|introduction to|note from")
+
+def find_footnote_separator(doc):
+    # detects horizontal line separator in an open PyMuPDF document
     try:
-        with pdfplumber.open(BytesIO(pdf_content)) as pdf:
-            main_text = ""
-            footnotes_text = ""
-            separator_found = False
-            separator_y = None
+        main_parts = []
+        footnote_parts = []
+        separator_found = False
+        separator_y = None
+        
+        for page_num, page in enumerate(doc):
+            page_height = page.rect.height
+            page_width = page.rect.width
             
-            for page_num, page in enumerate(pdf.pages):
-                page_height = page.height
-                page_width = page.width
-                
-                horizontal_lines = []
-                
-                # extracts lines
-                if hasattr(page, 'lines') and page.lines:
-                    for line in page.lines:
-                        try:
-                            x0, top, x1, bottom = line
-                            if abs(top - bottom) < 2:
-                                line_width = abs(x1 - x0)
-                                if line_width > page_width * 0.5:
-                                    horizontal_lines.append({
-                                        'y': top,
-                                        'x0': min(x0, x1),
-                                        'x1': max(x0, x1),
-                                        'width': line_width
-                                    })
-                        except (ValueError, TypeError):
-                            pass
-                
-                # extracts rects
-                if hasattr(page, 'rects') and page.rects:
-                    for rect in page.rects:
-                        try:
-                            x0, top, x1, bottom = rect
-                            height = abs(bottom - top)
-                            width = abs(x1 - x0)
-                            if height < 2 and width > page_width * 0.5:
-                                horizontal_lines.append({
-                                    'y': top,
-                                    'x0': min(x0, x1),
-                                    'x1': max(x0, x1),
-                                    'width': width
-                                })
-                        except (ValueError, TypeError):
-                            pass
-                
-                # finds the separators
-                separator_candidates = [
-                    line for line in horizontal_lines
-                    if page_height * 0.2 < line['y'] < page_height * 0.85
-                ]
-                
-                if separator_candidates:
-                    separator_line = min(
-                        separator_candidates,
-                        key=lambda x: abs(x['y'] - (page_height * 0.6))
-                    )
-                    separator_y = separator_line['y']
-                    separator_found = True
-                
-                page_text = page.extract_text() or ""
-                
-                if separator_found and separator_y is not None:
-                    main_crop = page.crop((0, 0, page_width, separator_y))
-                    main_text += (main_crop.extract_text() or "") + " "
+            # y of the long horizontal lines and thin rects in the band a separator can sit in
+            # (get_cdrawings skips building Point/Rect objects for every path item)
+            separator_candidates = []
+            for drawing in page.get_cdrawings():
+                # whole paths too narrow or entirely outside the band cannot hold a separator
+                dx0, dy0, dx1, dy1 = drawing["rect"]
+                if dx1 - dx0 <= page_width * 0.5 or dy1 <= page_height * 0.2 or dy0 >= page_height * 0.85:
+                    continue
+                for item in drawing["items"]:
+                    if item[0] == "l":
+                        (x0, top), (x1, bottom) = item[1], item[2]
+                    elif item[0] == "re":
+                        x0, top, x1, bottom = item[1]
+                    else:
+                        continue
                     
-                    footnote_crop = page.crop((0, separator_y, page_width, page_height))
-                    footnotes_text += (footnote_crop.extract_text() or "") + " "
-                else:
-                    main_text += page_text + " "
+                    y = min(top, bottom)
+                    if (abs(bottom - top) < 2 and abs(x1 - x0) > page_width * 0.5
+                            and page_height * 0.2 < y < page_height * 0.85):
+                        separator_candidates.append(y)
             
-            return (
-                main_text.strip(),
-                footnotes_text.strip(),
-                separator_y,
-                separator_found
-            )
+            # finds the separator closest to 60% down the page; it only splits the page it was found on
+            page_separator_y = None
+            if separator_candidates:
+                page_separator_y = min(separator_candidates, key=lambda y: abs(y - page_height * 0.6))
+                separator_y = page_separator_y
+                separator_found = True
+            
+            # one text extraction per page, text blocks (type 0) are bucketed by which side
+            # of the separator their vertical midpoint falls on
+            text_blocks = [block for block in page.get_text("blocks") if block[6] == 0]
+            if page_separator_y is not None:
+                main_parts.append("".join(block[4] for block in text_blocks if (block[1] + block[3]) / 2 < page_separator_y))
+                footnote_parts.append("".join(block[4] for block in text_blocks if (block[1] + block[3]) / 2 >= page_separator_y))
+            else:
+                main_parts.append("".join(block[4] for block in text_blocks))
+        
+        return (
+            " ".join(main_parts).strip(),
+            " ".join(footnote_parts).strip(),
+            separator_y,
+            separator_found
+        )
     except Exception as e:
         print(f" error finding separator: {e}")
         return "", "", None, False
 
 
-def extract_pdf_text_and_metadata(pdf_content):
-    # gives metadata based on extraction from pdfplumber
+def is_born_digital(doc):
+    # a pdf with no font resources on any page is page images only, so it has no text layer to extract
+    return any(page.get_fonts() for page in doc)
+
+
+def extract_pdf_text_and_metadata(pdf_path, page_title=None):
+    # gives metadata based on extraction from PyMuPDF; page_title is the landing page title if one was found
     try:
-        with pdfplumber.open(BytesIO(pdf_content)) as pdf:
-            num_pages = len(pdf.pages)
-        
-        main_text, footnotes_text, separator_y, has_separator = find_footnote_separator(pdf_content)
-        full_text = main_text + " " + footnotes_text
+        # opened once for the page count, the font check and the separator/text pass
+        with pymupdf.open(pdf_path) as doc:
+            num_pages = doc.page_count
+            
+            # scanned pdfs skip the separator search and text extraction, they would come back empty anyway
+            if is_born_digital(doc):
+                main_text, footnotes_text, separator_y, has_separator = find_footnote_separator(doc)
+            else:
+                main_text, footnotes_text, separator_y, has_separator = "", "", None, False
         
         main_word_count = len(main_text.split())
         footnote_word_count = len(footnotes_text.split())
-        total_word_count = len(full_text.split())
+        total_word_count = main_word_count + footnote_word_count
         
-        total_char_count = len(full_text)
-        char_count_no_space = len(''.join(c for c in full_text if not c.isspace()))
+        # counted as if main and footnote text were joined by one space, without building the joined copy
+        total_char_count = len(main_text) + 1 + len(footnotes_text)
+        whitespace_count = 1 + sum(map(main_text.count, WHITESPACE_CHARS)) + sum(map(footnotes_text.count, WHITESPACE_CHARS))
+        char_count_no_space = total_char_count - whitespace_count
         
         # to flag manual cases - for review
         flags = []
@@ -477,12 +699,12 @@ def extract_pdf_text_and_metadata(pdf_content):
         if num_pages > 3 and total_word_count < 100:
             flags.append("scanned_pdf_detected")
         
-        if "contents" in main_text.lower() or "table of" in main_text.lower():
+        main_text_lower = main_text.lower()
+        if _TOC_RE.search(main_text_lower):
             if main_text.count('\n') > total_word_count * 0.3:
                 flags.append("likely_table_of_contents")
         
-        intro_markers = ["editor", "foreword", "preface", "introduction to", "note from"]
-        if total_word_count < 800 and any(marker in main_text.lower() for marker in intro_markers):
+        if total_word_count < 800 and _INTRO_RE.search(main_text_lower):
             flags.append("likely_front_matter")
         
         return {
@@ -498,8 +720,7 @@ def extract_pdf_text_and_metadata(pdf_content):
             'separator_position': separator_y,
             'ocr_used': False,
             'flags': flags,
-            'text_extracted': full_text.strip(),
-            'title': 'unknown title'
+            'title': page_title or 'unknown title'
         }
     except Exception as e:
         print(f" PDF parsing error: {e}")
@@ -507,41 +728,275 @@ def extract_pdf_text_and_metadata(pdf_content):
 
 # scraping and metadata collection
 
-def scrape_law_journal(journal_name, base_url, journal_start_year, start_year, end_year):
-    # scrapes with new classification pipeline
+def revalidate_pdf(session, record, dest_dir=OUTPUT_DIR):
+    # conditional GET of a previously scraped pdf; returns (not_modified, download)
+    # a changed pdf comes back in full, so its body is streamed to a temp file as the download
+    # (landing page details carried over from record) instead of being fetched a second time
+    headers = {}
+    if record.get('pdf_etag'):
+        headers['If-None-Match'] = record['pdf_etag']
+    if record.get('pdf_last_modified'):
+        headers['If-Modified-Since'] = record['pdf_last_modified']
+    if not headers:
+        return False, None
+    
+    try:
+        with polite_request(session, "GET", record['pdf_url'], headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                return True, None
+            if not is_pdf_response(response):
+                return False, None
+            pdf_path, sha256 = stream_pdf(response, dest_dir)
+            return False, {
+                'pdf_path': pdf_path,
+                'title': record['title'],
+                'authors': record['authors'],
+                'author_count': record.get('author_count'),
+                'multi_author': record['multi_author'],
+                'pdf_url': record['pdf_url'],
+                'sha256': sha256,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+    except Exception as e:
+        print(f" revalidation error: {e}")
+        return False, None
+
+
+def list_issue_articles(session, issue_url):
+    # sorted article numbers linked from an issue's table of contents page, or None if there are none to read
+    try:
+        with polite_request(session, "GET", issue_url, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                return None
+            content = response.content
+    except Exception as e:
+        print(f" issue index error: {e}")
+        return None
+    
+    article_link = re.escape(urlparse(issue_url).path.encode()) + rb'(\d+)/?["\'#?]'
+    return sorted({int(number) for number in re.findall(article_link, content)}) or None
+
+
+def fetch_article(url, session, parse_pool, parsed_digests, cached_record=None, probe=True):
+    # runs on an I/O thread and returns (cached_record, download, parse_future):
+    # either the cached record is still current, or the article is downloaded and
+    # its pdf handed to the parsing process pool (unless its digest is in parsed_digests)
+    download = None
+    if cached_record is not None:
+        not_modified, download = revalidate_pdf(session, cached_record)
+        if not_modified:
+            return cached_record, None, None
+    
+    if download is None:
+        download = download_pdf(url, session, probe=probe)
+    parse_future = None
+    if download and download['sha256'] not in parsed_digests:
+        parse_future = parse_pool.submit(extract_pdf_text_and_metadata, download['pdf_path'], download['title'])
+    return None, download, parse_future
+
+
+def discard_article(future):
+    # drops the temp pdf of a download that finished after its issue was done
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, download, parse_future = future.result()
+    if download:
+        if parse_future is not None:
+            parse_future.cancel()
+        os.remove(download['pdf_path'])
+
+def write_json(path, obj):
+    # indented json file, encoded by orjson straight to bytes when it is installed
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def json_text(obj):
+    # compact json string, via orjson when it is installed
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
+class CacheShelf:
+    # the scrape cache shelve, opened and used only on its own thread so the journal threads can share it
+    # (dbm.sqlite3, the default backend for new files from python 3.13, only works on the thread that opened it)
+    
+    def __init__(self, path):
+        self._thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape-cache")
+        self._shelf = self._run(shelve.open, path)
+    
+    def _run(self, fn, *args):
+        return self._thread.submit(fn, *args).result()
+    
+    def __contains__(self, key):
+        return self._run(self._shelf.__contains__, key)
+    
+    def __getitem__(self, key):
+        return self._run(self._shelf.__getitem__, key)
+    
+    def __setitem__(self, key, value):
+        self._run(self._shelf.__setitem__, key, value)
+    
+    def get(self, key, default=None):
+        return self._run(self._shelf.get, key, default)
+    
+    def keys(self):
+        return self._run(list, self._shelf)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        try:
+            self._run(self._shelf.close)
+        finally:
+            self._thread.shutdown()
+
+
+class ResultWriter:
+    # writes each article record to the results csv and jsonl as soon as it is scraped, so a crash loses nothing
+    # (journals are scraped concurrently, so rows from different journals interleave in the order they
+    # finish - sort on journal/year/issue/article, the parquet copy keeps one journal after another)
+    
+    def __init__(self, csv_path, jsonl_path):
+        self._file = open(csv_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=list(RESULT_COLUMNS), extrasaction='ignore')
+        self._writer.writeheader()
+        self._jsonl_file = open(jsonl_path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+    
+    def write(self, record):
+        line = json_text({column: record.get(column) for column in RESULT_COLUMNS})
+        with self._lock:
+            self._writer.writerow(record)
+            self._file.flush()
+            self._jsonl_file.write(line + '\n')
+            self._jsonl_file.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._file.close()
+        self._jsonl_file.close()
+
+
+def scrape_law_journal(journal_name, base_url, journal_start_year, start_year, end_year,
+                       executor, parse_pool, cache, parsed_digests, writer, session, stop_event):
+    # scrapes with new classification pipeline; downloads run on executor, parsing on parse_pool
+    # and every record is streamed to writer (a ResultWriter)
+    # returns (results, flagged articles, classification log) so journals can be scraped concurrently;
+    # stops at the next article once stop_event (a threading.Event) is set
+    # urls already in cache (a CacheShelf of url -> article record) are not fetched again,
+    # or only revalidated when REVALIDATE_CACHE is set; pdfs whose digest is in parsed_digests
+    # reuse the parse metadata cached for that digest and are only classified again
     
     print(f" scraping {journal_name} ({start_year}---{end_year})") 
     print(f" saving downloads to: {OUTPUT_FOLDER}/\n")
 
-    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    file_prefix = journal_name.replace(' ', '_').lower()
     results = []
     flagged_articles = []
     classifier = LawReviewClassifier()
 
     for year in range(start_year, end_year + 1):
+        if stop_event.is_set():
+            break
         volume = year - journal_start_year + 1
-        print(f"\n Year {year} (Volume {volume})")
+        print(f"\n [{journal_name}] Year {year} (Volume {volume})")
 
         for issue in range(1, 7):
-            print(f" Issue {issue}:")
+            if stop_event.is_set():
+                break
+            # journals print concurrently, so every issue and article line names its journal
+            issue_tag = f"[{journal_name}] {year} Issue {issue}"
+            print(f" {issue_tag}:")
 
             articles_found = 0
             consecutive_failures = 0
+            pending = {}
+            
+            # falls back to probing articles 1-20 when the issue page lists none;
+            # articles the issue page links to exist, so only the fallback needs the HEAD probe
+            article_nums = None
+            if ISSUE_INDEX:
+                issue_url = base_url.format(volume=volume, issue=issue, article='').rstrip('/') + '/'
+                article_nums = list_issue_articles(session, issue_url)
+            probe = article_nums is None
+            article_nums = article_nums or list(range(1, 21))
 
-            for article_num in range(1, 21):
-                if consecutive_failures >= 3:
+            for position, article_num in enumerate(article_nums):
+                if consecutive_failures >= 3 or stop_event.is_set():
                     break
 
-                url = base_url.format(volume=volume, issue=issue, article=article_num)
-                pdf_content, page_title, authors_string, is_multi_author = download_pdf(url)
+                # keeps a window of downloads in flight ahead of the article being processed
+                for ahead in article_nums[position:position + DOWNLOAD_WORKERS]:
+                    if ahead not in pending:
+                        ahead_url = base_url.format(volume=volume, issue=issue, article=ahead)
+                        if ahead_url in cache and not REVALIDATE_CACHE:
+                            pending[ahead] = (ahead_url, None)
+                        else:
+                            pending[ahead] = (ahead_url, executor.submit(
+                                fetch_article, ahead_url, session, parse_pool, parsed_digests, cache.get(ahead_url), probe))
+
+                url, fetch_future = pending.pop(article_num)
+                if fetch_future is None:
+                    cached_record, download, parse_future = cache[url], None, None
+                else:
+                    cached_record, download, parse_future = fetch_future.result()
 
-                if pdf_content:
-                    metadata = extract_pdf_text_and_metadata(pdf_content)
+                if cached_record is not None:
+                    results.append(cached_record)
+                    writer.write(cached_record)
+                    classifier.log_cached(cached_record)
+                    print(f" {issue_tag} Article {article_num}: cached → {cached_record['classification_label']}")
+                    articles_found += 1
+                    consecutive_failures = 0
+                    continue
+
+                if download:
+                    pdf_path = download['pdf_path']
+                    authors_string = download['authors']
+                    is_multi_author = download['multi_author']
+                    filename = f"{file_prefix}_{year}_vol{volume}_iss{issue}_art{article_num}.pdf"
+                    article_identity = {
+                        'journal': journal_name,
+                        'year': year,
+                        'volume': volume,
+                        'issue': issue,
+                        'article': article_num,
+                        'title': download['title'] or 'unknown title',
+                        'authors': authors_string,
+                        'author_count': download['author_count'],
+                        'multi_author': is_multi_author,
+                        'url': url,
+                        'filename': filename,
+                        'pdf_sha256': download['sha256'],
+                        'pdf_url': download['pdf_url'],
+                        'pdf_etag': download['etag'],
+                        'pdf_last_modified': download['last_modified']
+                    }
+                    
+                    if parse_future is None:
+                        # same pdf bytes as an article parsed before: the parse is reused but the article is
+                        # still classified for its own year (step C compares class years against it);
+                        # the copy already in downloads is kept as the one file for both articles
+                        parsed = cache[DIGEST_KEY_PREFIX + download['sha256']]
+                        metadata = {**parsed, 'title': download['title'] or 'unknown title'}
+                        if (OUTPUT_DIR / parsed['filename']).exists():
+                            article_identity['filename'] = parsed['filename']
+                    else:
+                        metadata = parse_future.result()
+                    article_record = None
 
                     if metadata:
-                        if metadata['title'] == "unknown title" and page_title:
-                            metadata['title'] = page_title
-                        
                         if metadata['flags']:
                             flagged_articles.append({
                                 'journal': journal_name,
@@ -554,7 +1009,8 @@ def scrape_law_journal(journal_name, base_url, journal_start_year, start_year, e
                                 'word_count': metadata['words'],
                                 'pages': metadata['pages']
                             })
-                            print(f"  ⚠️  Article {article_num} flagged: {metadata['flags']}")
+                            print(f"  ⚠️  {issue_tag} Article {article_num} flagged: {metadata['flags']}")
+                            os.remove(pdf_path)
                             consecutive_failures += 1
                             continue
                         
@@ -564,25 +1020,14 @@ def scrape_law_journal(journal_name, base_url, journal_start_year, start_year, e
                             'authors': authors_string,
                             'words': metadata['words'],
                             'pages': metadata['pages'],
-                            'main_text': metadata['main_text']
+                            'main_text': metadata['main_text'],
+                            'footnotes_text': metadata['footnotes_text']
                         }
                         
                         classification_result = classifier.classify(paper_data, year)
-                        
-                        filename = f"{journal_name.replace(' ', '_').lower()}_{year}_vol{volume}_iss{issue}_art{article_num}.pdf"
-                        filepath = os.path.join(OUTPUT_FOLDER, filename)
-                        with open(filepath, "wb") as f:
-                            f.write(pdf_content)
 
                         article_record = {
-                            'journal': journal_name,
-                            'year': year,
-                            'volume': volume,
-                            'issue': issue,
-                            'article': article_num,
-                            'title': metadata['title'],
-                            'authors': authors_string,
-                            'multi_author': is_multi_author,
+                            **article_identity,
                             'words': metadata['words'],
                             'main_text_words': metadata['main_text_words'],
                             'footnote_words': metadata['footnote_words'],
@@ -593,56 +1038,78 @@ def scrape_law_journal(journal_name, base_url, journal_start_year, start_year, e
                             'ocr_used': metadata['ocr_used'],
                             'classification_label': classification_result['label'],
                             'classification_steps': classification_result['steps'],
-                            'requires_manual_review': classification_result.get('requires_manual_review', False),
-                            'url': url,
-                            'filename': filename
+                            'requires_manual_review': classification_result.get('requires_manual_review', False)
                         }
-                        
+                        if parse_future is not None:
+                            cache[DIGEST_KEY_PREFIX + download['sha256']] = {**metadata, 'filename': article_record['filename']}
+                            parsed_digests.add(download['sha256'])
+
+                    if article_record:
+                        os.replace(pdf_path, OUTPUT_DIR / article_record['filename'])
                         results.append(article_record)
+                        writer.write(article_record)
+                        cache[url] = article_record
 
                         author_marker = " [Multi-Author]" if is_multi_author else ""
-                        label_marker = f" → {classification_result['label']}"
-                        print(f" Article {article_num}: {metadata['words']} words / {metadata['pages']} pages{author_marker}{label_marker}")
+                        label_marker = f" → {article_record['classification_label']}"
+                        print(f" {issue_tag} Article {article_num}: {article_record['words']} words / {article_record['pages']} pages{author_marker}{label_marker}")
                         articles_found += 1
                         consecutive_failures = 0
                     else:
+                        os.remove(pdf_path)
                         consecutive_failures += 1
                 else:
                     consecutive_failures += 1
-                
-                sleep(0.5)
 
-            if articles_found == 0:
-                print(f" no articles found")
-                break
+            # end of issue reached - drop downloads that have not started yet
+            for _, future in pending.values():
+                if future is not None and not future.cancel():
+                    future.add_done_callback(discard_article)
 
-    if flagged_articles:
-        with open(FLAGGED_ISSUES_JSON, 'w') as f:
-            json.dump(flagged_articles, f, indent=2)
-        print(f"\n⚠️  Flagged {len(flagged_articles)} articles - see {FLAGGED_ISSUES_JSON}")
+            if articles_found == 0 and not stop_event.is_set():
+                print(f" {issue_tag}: no articles found")
+                break
 
-    # Save classification log
-    with open(CLASSIFICATION_LOG, 'w') as f:
-        json.dump(classifier.classification_log, f, indent=2)
-    print(f"✓ Classification log saved to {CLASSIFICATION_LOG}")
+    print(f"\n✓ Finished {journal_name}: {len(results)} articles, {len(flagged_articles)} flagged")
 
-    return results
+    return results, flagged_articles, classifier.classification_log
 
 # analysis and results BELOW
 
+def results_to_dataframe(results):
+    # builds the frame column by column with fixed dtypes instead of letting pandas infer per row
+    return pd.DataFrame({
+        column: pd.Series([record.get(column) for record in results], dtype=dtype or object)
+        for column, dtype in RESULT_COLUMNS.items()
+    })
+
 def save_results(results):
-    # gives us summaries of the metadata found
-    df = pd.DataFrame(results)
-    df.to_csv(RESULTS_CSV, index=False)
-    df.to_json(RESULTS_CSV.replace('.csv', '.json'), orient='records', indent=2)
+    # gives us summaries of the metadata found (the csv and jsonl themselves are written during the scrape)
+    df = results_to_dataframe(results)
     
-    print(f"\n✓ Saved {len(results)} articles to {RESULTS_CSV}")
+    print(f"\n✓ Saved {len(results)} articles to {RESULTS_CSV} and {RESULTS_JSONL}")
+    
+    if pq is not None:
+        # typed columnar copy for analysis; steps vary in shape per record so they go in as json text
+        steps_json = df['classification_steps'].map(json_text)
+        table = pa.Table.from_pandas(df.assign(classification_steps=steps_json), preserve_index=False)
+        pq.write_table(table, RESULTS_PARQUET)
+        print(f"✓ Saved columnar copy to {RESULTS_PARQUET}")
+    
+    # all summary numbers in one agg call
+    stats = df.agg({
+        'year': ['min', 'max'],
+        'words': ['mean'],
+        'pages': ['mean'],
+        'multi_author': ['sum'],
+        'requires_manual_review': ['sum']
+    })
     print(f"\nSUMMARY STATISTICS:")
     print(f"  Total articles: {len(results)}")
-    print(f"  Year range: {int(df['year'].min())} - {int(df['year'].max())}")
-    print(f"  Average words: {df['words'].mean():.0f}")
-    print(f"  Average pages: {df['pages'].mean():.1f}")
-    print(f"  Multi-author articles: {int(df['multi_author'].sum())}")
+    print(f"  Year range: {int(stats.at['min', 'year'])} - {int(stats.at['max', 'year'])}")
+    print(f"  Average words: {stats.at['mean', 'words']:.0f}")
+    print(f"  Average pages: {stats.at['mean', 'pages']:.1f}")
+    print(f"  Multi-author articles: {int(stats.at['sum', 'multi_author'])}")
     
     # classification results
     print(f"\nCLASSIFICATION RESULTS:")
@@ -652,8 +1119,8 @@ def save_results(results):
         print(f"  {label}: {count} ({pct:.1f}%)")
     
     # keeps track of ERROR labels
-    error_count = (df['classification_label'] == 'ERROR').sum()
-    manual_review_count = df['requires_manual_review'].sum()
+    error_count = label_counts.get('ERROR', 0)
+    manual_review_count = int(stats.at['sum', 'requires_manual_review'])
     print(f"\nQUALITY METRICS:")
     print(f"  ERROR labels: {error_count}")
     print(f"  Requiring manual review: {manual_review_count}")
@@ -665,29 +1132,87 @@ def main():
     print("law review analysis (v3 - enhanced classification pipeline)")
     print("=" * 60)
     
-    duke_results = scrape_law_journal(
-        journal_name='Duke Law Journal',
-        base_url=BASE_URL,
-        journal_start_year=DUKE_JOURNAL_START_YEAR,
-        start_year=START_YEAR,
-        end_year=END_YEAR
-    )
-
-    pepperdine_results = scrape_law_journal(
-        journal_name='Pepperdine Law Review',
-        base_url=PEPPERDINE_BASE_URL,
-        journal_start_year=PEPPERDINE_JOURNAL_START_YEAR,
-        start_year=START_YEAR,
-        end_year=END_YEAR
-    )
-
-    uchicago_results = scrape_law_journal(
-        journal_name='University of Chicago Law Review',
-        base_url=UCHICAGO_BASE_URL,
-        journal_start_year=UCHICAGO_JOURNAL_START_YEAR,
-        start_year=START_YEAR,
-        end_year=END_YEAR
-    )
+    # one session, cache, csv writer, parse pool and download pool shared by every journal;
+    # the journals sit on different hosts with their own rate limits, so they are scraped concurrently
+    # (journals finish first, then downloads, since they feed the parse pool)
+    with make_session() as session, \
+            CacheShelf(SCRAPE_CACHE) as cache, \
+            ResultWriter(RESULTS_CSV, RESULTS_JSONL) as writer, \
+            ProcessPoolExecutor(max_workers=PARSE_WORKERS,
+                                mp_context=multiprocessing.get_context(PARSE_START_METHOD)) as parse_pool, \
+            ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS * 3) as executor, \
+            ThreadPoolExecutor(max_workers=3) as journal_pool:
+        parsed_digests = {key[len(DIGEST_KEY_PREFIX):] for key in cache.keys() if key.startswith(DIGEST_KEY_PREFIX)}
+        stop_event = threading.Event()
+        
+        duke_future = journal_pool.submit(
+            scrape_law_journal,
+            journal_name='Duke Law Journal',
+            base_url=BASE_URL,
+            journal_start_year=DUKE_JOURNAL_START_YEAR,
+            start_year=START_YEAR,
+            end_year=END_YEAR,
+            executor=executor,
+            parse_pool=parse_pool,
+            cache=cache,
+            parsed_digests=parsed_digests,
+            writer=writer,
+            session=session,
+            stop_event=stop_event
+        )
+
+        pepperdine_future = journal_pool.submit(
+            scrape_law_journal,
+            journal_name='Pepperdine Law Review',
+            base_url=PEPPERDINE_BASE_URL,
+            journal_start_year=PEPPERDINE_JOURNAL_START_YEAR,
+            start_year=START_YEAR,
+            end_year=END_YEAR,
+            executor=executor,
+            parse_pool=parse_pool,
+            cache=cache,
+            parsed_digests=parsed_digests,
+            writer=writer,
+            session=session,
+            stop_event=stop_event
+        )
+
+        uchicago_future = journal_pool.submit(
+            scrape_law_journal,
+            journal_name='University of Chicago Law Review',
+            base_url=UCHICAGO_BASE_URL,
+            journal_start_year=UCHICAGO_JOURNAL_START_YEAR,
+            start_year=START_YEAR,
+            end_year=END_YEAR,
+            executor=executor,
+            parse_pool=parse_pool,
+            cache=cache,
+            parsed_digests=parsed_digests,
+            writer=writer,
+            session=session,
+            stop_event=stop_event
+        )
+        
+        try:
+            duke_results, duke_flagged, duke_log = duke_future.result()
+            pepperdine_results, pepperdine_flagged, pepperdine_log = pepperdine_future.result()
+            uchicago_results, uchicago_flagged, uchicago_log = uchicago_future.result()
+        except BaseException:
+            # ctrl-c or a failed journal: the other journals stop at their next article and
+            # queued downloads and parses are dropped, so leaving the pools does not wait on them
+            stop_event.set()
+            for pool in (journal_pool, executor, parse_pool):
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    flagged_articles = duke_flagged + pepperdine_flagged + uchicago_flagged
+    if flagged_articles:
+        write_json(FLAGGED_ISSUES_JSON, flagged_articles)
+        print(f"\n⚠️  Flagged {len(flagged_articles)} articles - see {FLAGGED_ISSUES_JSON}")
+
+    # Save classification log
+    write_json(CLASSIFICATION_LOG, duke_log + pepperdine_log + uchicago_log)
+    print(f"✓ Classification log saved to {CLASSIFICATION_LOG}")
     
     results = duke_results + pepperdine_results + uchicago_results
 